@@ -0,0 +1,80 @@
+"""Kernel Dijkstra ter-JIT (Numba) di atas array CSR.
+
+Modul ini opsional: `graf.py` hanya mengimpornya jika Numba terpasang.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def dijkstra_csr(
+    indptr: np.ndarray, indices: np.ndarray, weights: np.ndarray, src: int
+) -> np.ndarray:
+    """Dijkstra dengan binary heap manual (array `heap_d`/`heap_v`).
+
+    Entri heap yang basi (jaraknya lebih besar dari `dist[u]`) dilewati saat di-pop.
+    Mengembalikan array jarak seperti `Graf._dijkstra_csr`.
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+
+    # Setiap relaksasi mendorong paling banyak satu entri per edge, ditambah source.
+    capacity = indices.shape[0] + 1
+    heap_d = np.empty(capacity, dtype=np.float64)
+    heap_v = np.empty(capacity, dtype=np.int32)
+    size = 0
+
+    dist[src] = 0.0
+    heap_d[0] = 0.0
+    heap_v[0] = src
+    size = 1
+
+    while size > 0:
+        d = heap_d[0]
+        u = heap_v[0]
+
+        # pop: pindahkan elemen terakhir ke root lalu sift-down
+        size -= 1
+        if size > 0:
+            last_d = heap_d[size]
+            last_v = heap_v[size]
+            i = 0
+            while True:
+                child = 2 * i + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap_d[child + 1] < heap_d[child]:
+                    child += 1
+                if heap_d[child] >= last_d:
+                    break
+                heap_d[i] = heap_d[child]
+                heap_v[i] = heap_v[child]
+                i = child
+            heap_d[i] = last_d
+            heap_v[i] = last_v
+
+        if d > dist[u]:
+            continue
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            nd = d + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+
+                # push: sift-up dari posisi terakhir
+                i = size
+                size += 1
+                while i > 0:
+                    parent = (i - 1) // 2
+                    if heap_d[parent] <= nd:
+                        break
+                    heap_d[i] = heap_d[parent]
+                    heap_v[i] = heap_v[parent]
+                    i = parent
+                heap_d[i] = nd
+                heap_v[i] = v
+
+    return dist
@@ -1,6 +1,8 @@
 """Script untuk generate visualisasi graf AFL-3."""
 from __future__ import annotations
 
+import hashlib
+import shutil
 import sys
 from pathlib import Path
 
@@ -8,49 +10,68 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+import matplotlib
+
+matplotlib.use("Agg")
+
 import matplotlib.pyplot as plt
 import networkx as nx
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
 from graf import Graf
 
 IMG_DIR = Path(__file__).parent / "images"
 IMG_DIR.mkdir(exist_ok=True)
 
+# Kode yang menentukan hasil gambar: script ini (warna, ukuran, judul, dpi) dan
+# graf.py (layout/seed, pemilihan jalur terpendek). Isinya ikut masuk hash cache.
+RENDER_SOURCES = (Path(__file__).resolve(), ROOT / "graf.py")
 
-def save_graf_soal1() -> None:
-    """Generate visualisasi graf Soal 1."""
+
+def _graph_key(g: Graf) -> str:
+    """Hash isi graf (node, edge + bobot) dan kode penggambarnya, dipakai untuk nama file cache."""
+    spec = (sorted(g.nodes(), key=str), sorted(g.edges(data=True), key=repr))
+    h = hashlib.sha1(repr(spec).encode())
+    for src in RENDER_SOURCES:
+        h.update(src.read_bytes())
+    h.update(f"matplotlib={matplotlib.__version__} networkx={nx.__version__}".encode())
+    return h.hexdigest()[:12]
+
+
+def _cached_file(out: Path, key: str) -> Path:
+    return out.with_name(f"{out.stem}.{key}{out.suffix}")
+
+
+def _restore_cached(out: Path, key: str) -> bool:
+    """Salin gambar hasil render sebelumnya ke `out` jika ada. Return True jika cache dipakai."""
+    cached = _cached_file(out, key)
+    if not cached.exists():
+        return False
+    shutil.copyfile(cached, out)
+    print(f"✓ Cached: {out}")
+    return True
+
+
+def _save_figure(fig: Figure, out: Path, key: str) -> None:
+    cached = _cached_file(out, key)
+    fig.savefig(cached, dpi=150, bbox_inches="tight")
+    shutil.copyfile(cached, out)
+    print(f"✓ Saved: {out}")
+
+
+def build_graf_soal1() -> Graf:
+    """Graf tak berarah Soal 1."""
     g = Graf()
     g.add_nodes(["A", "B", "C", "D", "E", "F"])
     edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "E"), ("E", "F"), ("C", "F")]
     for u, v in edges:
         g.add_edge(u, v, weight=1)
+    return g
 
-    pos = g._layout("spring")
-    plt.figure(figsize=(8, 6))
 
-    nx.draw(
-        g.G,
-        pos,
-        with_labels=True,
-        node_size=1200,
-        font_size=14,
-        node_color="lightblue",
-        edge_color="gray",
-        width=2,
-    )
-    edge_labels = {(u, v): "" for u, v in g.G.edges()}
-    nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels)
-    plt.title("AFL-3 Soal 1 — Graf Tak Berarah", fontsize=16, fontweight="bold")
-    plt.axis("off")
-    plt.tight_layout()
-    out = IMG_DIR / "soal1_graph.png"
-    plt.savefig(out, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"✓ Saved: {out}")
-
-
-def save_graf_soal3() -> None:
-    """Generate visualisasi graf Soal 3 (normal & dengan jalur terpendek)."""
+def build_graf_soal3() -> Graf:
+    """Graf berbobot Soal 3."""
     g = Graf()
     g.add_nodes(["A", "B", "C", "D", "E", "F", "G"])
     edges = [
@@ -65,66 +86,97 @@ def save_graf_soal3() -> None:
     ]
     for u, v, w in edges:
         g.add_edge(u, v, weight=w)
+    return g
+
+
+def save_graf_soal1(g: Graf, fig: Figure, ax: Axes) -> None:
+    """Generate visualisasi graf Soal 1."""
+    key = _graph_key(g)
+    out = IMG_DIR / "soal1_graph.png"
+    if _restore_cached(out, key):
+        return
 
     pos = g._layout("spring")
+    ax.clear()
 
-    # Graf biasa
-    plt.figure(figsize=(8, 6))
     nx.draw(
         g.G,
         pos,
         with_labels=True,
         node_size=1200,
         font_size=14,
-        node_color="lightgreen",
+        node_color="lightblue",
         edge_color="gray",
         width=2,
+        ax=ax,
     )
-    edge_labels = g._edge_labels_for_drawing()
-    nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels, font_size=11)
-    plt.title("AFL-3 Soal 3 — Graf Berbobot", fontsize=16, fontweight="bold")
-    plt.axis("off")
-    plt.tight_layout()
-    out1 = IMG_DIR / "soal3_graph.png"
-    plt.savefig(out1, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"✓ Saved: {out1}")
+    edge_labels = {(u, v): "" for u, v in g.G.edges()}
+    nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels, ax=ax)
+    ax.set_title("AFL-3 Soal 1 — Graf Tak Berarah", fontsize=16, fontweight="bold")
+    ax.set_axis_off()
+    _save_figure(fig, out, key)
 
-    # Graf dengan jalur terpendek A→G
-    path = g.shortest_path("A", "G")
-    path_edges = list(zip(path[:-1], path[1:]))
 
-    plt.figure(figsize=(8, 6))
-    nx.draw(
-        g.G,
-        pos,
-        with_labels=True,
-        node_size=1200,
-        font_size=14,
-        node_color="lightgreen",
-        edge_color="gray",
-        width=1.5,
-    )
-    nx.draw_networkx_edges(g.G, pos, edgelist=path_edges, width=4, edge_color="red")
-    nx.draw_networkx_nodes(g.G, pos, nodelist=path, node_size=1300, node_color="yellow")
-    nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels, font_size=11)
-    plt.title(f"AFL-3 Soal 3 — Jalur Terpendek A → G: {path}", fontsize=14, fontweight="bold")
-    plt.axis("off")
-    plt.tight_layout()
+def save_graf_soal3(g: Graf, fig: Figure, ax: Axes) -> None:
+    """Generate visualisasi graf Soal 3 (normal & dengan jalur terpendek)."""
+    key = _graph_key(g)
+    out1 = IMG_DIR / "soal3_graph.png"
     out2 = IMG_DIR / "soal3_shortest_path.png"
-    plt.savefig(out2, dpi=150, bbox_inches="tight")
-    plt.close()
-    print(f"✓ Saved: {out2}")
+    need_graph = not _restore_cached(out1, key)
+    need_path = not _restore_cached(out2, key)
+    if not (need_graph or need_path):
+        return
 
+    # Dipakai bersama oleh kedua gambar
+    pos = g._layout("spring")
+    edge_labels = g._edge_labels_for_drawing()
 
-def print_soal1_terminal() -> None:
-    """Print hasil analisis Soal 1 ke terminal."""
-    g = Graf()
-    g.add_nodes(["A", "B", "C", "D", "E", "F"])
-    edges = [("A", "B"), ("A", "C"), ("B", "D"), ("C", "E"), ("D", "E"), ("E", "F"), ("C", "F")]
-    for u, v in edges:
-        g.add_edge(u, v, weight=1)
+    # Graf biasa
+    if need_graph:
+        ax.clear()
+        nx.draw(
+            g.G,
+            pos,
+            with_labels=True,
+            node_size=1200,
+            font_size=14,
+            node_color="lightgreen",
+            edge_color="gray",
+            width=2,
+            ax=ax,
+        )
+        nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels, font_size=11, ax=ax)
+        ax.set_title("AFL-3 Soal 3 — Graf Berbobot", fontsize=16, fontweight="bold")
+        ax.set_axis_off()
+        _save_figure(fig, out1, key)
 
+    # Graf dengan jalur terpendek A→G
+    if need_path:
+        path = g.shortest_path("A", "G")
+        path_edges = list(zip(path[:-1], path[1:]))
+
+        ax.clear()
+        nx.draw(
+            g.G,
+            pos,
+            with_labels=True,
+            node_size=1200,
+            font_size=14,
+            node_color="lightgreen",
+            edge_color="gray",
+            width=1.5,
+            ax=ax,
+        )
+        nx.draw_networkx_edges(g.G, pos, edgelist=path_edges, width=4, edge_color="red", ax=ax)
+        nx.draw_networkx_nodes(g.G, pos, nodelist=path, node_size=1300, node_color="yellow", ax=ax)
+        nx.draw_networkx_edge_labels(g.G, pos, edge_labels=edge_labels, font_size=11, ax=ax)
+        ax.set_title(f"AFL-3 Soal 3 — Jalur Terpendek A → G: {path}", fontsize=14, fontweight="bold")
+        ax.set_axis_off()
+        _save_figure(fig, out2, key)
+
+
+def print_soal1_terminal(g: Graf) -> None:
+    """Print hasil analisis Soal 1 ke terminal."""
     degrees = g.degree()
     cycles = g.cycles()
     connected = g.is_connected()
@@ -148,23 +200,8 @@ def print_soal1_terminal() -> None:
     print("=" * 60)
 
 
-def print_soal3_terminal() -> None:
+def print_soal3_terminal(g: Graf) -> None:
     """Print hasil analisis Soal 3 ke terminal."""
-    g = Graf()
-    g.add_nodes(["A", "B", "C", "D", "E", "F", "G"])
-    edges = [
-        ("A", "B", 2),
-        ("A", "C", 5),
-        ("B", "D", 4),
-        ("B", "E", 6),
-        ("C", "F", 3),
-        ("D", "G", 2),
-        ("E", "F", 4),
-        ("F", "G", 1),
-    ]
-    for u, v, w in edges:
-        g.add_edge(u, v, weight=w)
-
     bfs = g.bfs_order("A", sort_neighbors=True)
     dfs = g.dfs_recursive("A", sort_neighbors=True)
     dists = g.dijkstra_distances("A")
@@ -193,19 +230,24 @@ def print_soal3_terminal() -> None:
 
 
 def main() -> None:
+    g1 = build_graf_soal1()
+    g3 = build_graf_soal3()
+
     print("Generating AFL-3 visualizations...\n")
-    save_graf_soal1()
-    save_graf_soal3()
+    fig, ax = plt.subplots(figsize=(8, 6), layout="constrained")
+    save_graf_soal1(g1, fig, ax)
+    save_graf_soal3(g3, fig, ax)
+    plt.close(fig)
 
     print("\n" + "=" * 60)
     print("Terminal Output - Soal 1")
     print("=" * 60 + "\n")
-    print_soal1_terminal()
+    print_soal1_terminal(g1)
 
     print("\n\n" + "=" * 60)
     print("Terminal Output - Soal 3")
     print("=" * 60 + "\n")
-    print_soal3_terminal()
+    print_soal3_terminal(g3)
 
     print(f"\n\n✓ All images generated successfully in: {IMG_DIR}")
 
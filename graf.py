@@ -1,15 +1,71 @@
 from __future__ import annotations
 
+import math
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import chain
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 
 
 Node = Any
 Edge = Tuple[Node, Node]
 
+# Memakai Numba ada biaya tetap sekali per proses (import + memuat kernel dari cache,
+# ~0,5 detik atau lebih), sedangkan Dijkstra Python biasa ~1 µs per entri CSR.
+# Titik impas baru tercapai sekitar sejuta entri CSR (edge tak-berarah dihitung dua kali).
+_NUMBA_MIN_CSR_ENTRIES = 1_000_000
+
+
+@lru_cache(maxsize=None)
+def _load_numba_dijkstra() -> Optional[Callable[..., np.ndarray]]:
+    """Kernel Dijkstra Numba jika Numba terpasang, selain itu None."""
+    try:
+        from _dijkstra_numba import dijkstra_csr
+    except ImportError:
+        return None
+    return dijkstra_csr
+
+
+def _compute_layout(G: nx.Graph, layout: str) -> Dict[Node, Tuple[float, float]]:
+    if layout == "spring":
+        return nx.spring_layout(G, seed=42)
+    if layout == "kamada_kawai":
+        return nx.kamada_kawai_layout(G)
+    if layout == "circular":
+        return nx.circular_layout(G)
+    if layout == "shell":
+        return nx.shell_layout(G)
+    raise ValueError("layout tidak dikenal. Pilih: spring|kamada_kawai|circular|shell")
+
+
+@lru_cache(maxsize=32)
+def _shared_layout(
+    layout: str,
+    graph_type: type,
+    nodes: Tuple[Node, ...],
+    edges: Tuple[Tuple[Node, Node, Any], ...],
+) -> Dict[Node, Tuple[float, float]]:
+    """Layout untuk graf yang dideskripsikan oleh (tipe, node, edge+bobot), di-cache lintas instance.
+
+    Urutan node ikut jadi key karena posisi awal spring layout bergantung padanya.
+    Posisi disimpan sebagai array read-only karena dipakai bersama; pemanggil
+    harus menyalinnya sebelum dikembalikan ke pengguna.
+    """
+    G = graph_type()
+    G.add_nodes_from(nodes)
+    G.add_weighted_edges_from(edges)
+    pos: Dict[Node, np.ndarray] = {}
+    for n, p in _compute_layout(G, layout).items():
+        arr = np.array(p, dtype=np.float64)
+        arr.setflags(write=False)
+        pos[n] = arr
+    return pos
+
 
 @dataclass(frozen=True)
 class DrawOptions:
@@ -19,6 +75,61 @@ class DrawOptions:
     font_size: int = 10
 
 
+@dataclass(frozen=True)
+class _CSR:
+    """Adjacency graf dalam format CSR (compressed sparse row).
+
+    Tetangga node ke-i ada di `indices[indptr[i]:indptr[i + 1]]` dengan bobot
+    pada posisi yang sama di `weights`. Array NumPy dipakai kernel Numba dan operasi
+    vektor; salinan list (`*_list`) dipakai loop Python biasa agar tidak perlu
+    `.tolist()` di setiap query.
+    """
+
+    index: Dict[Node, int]
+    nodes: List[Node]
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+    indptr_list: List[int]
+    indices_list: List[int]
+    weights_list: List[float]
+    has_negative: bool
+
+    def position(self, node: Node) -> int:
+        """Indeks node di array CSR; ValueError seperti `Graf._require_node` jika tidak ada."""
+        try:
+            return self.index[node]
+        except KeyError:
+            raise ValueError(f"Node {node!r} tidak ada di graf") from None
+
+
+class _DisjointSet:
+    """Union-find berbasis array (path halving + union by rank) untuk indeks 0..n-1."""
+
+    def __init__(self, n: int):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+
+    def find(self, i: int) -> int:
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        """Gabungkan himpunan a dan b. Return False jika keduanya sudah satu himpunan."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        return True
+
+
 class Graf:
     """Wrapper sederhana untuk belajar teori graf memakai NetworkX.
 
@@ -38,20 +149,33 @@ class Graf:
         else:
             self.G = nx.Graph()
 
+        # Cache turunan graf; dibangun saat dibutuhkan, di-reset setiap mutasi.
+        self._rank: Optional[Dict[Node, int]] = None
+        self._sorted_adj: Optional[Dict[Node, List[Node]]] = None
+        self._layout_cache: Dict[str, Dict[Node, Tuple[float, float]]] = {}
+        self._csr_cache: Dict[str, _CSR] = {}
+        self._astar_cache: Dict[
+            str,
+            Tuple[Optional[Dict[Node, Tuple[float, float]]], Dict[Node, Tuple[float, float]], Optional[float]],
+        ] = {}
+
     # ----------------------------
     # Metode dasar (rubrik)
     # ----------------------------
     def add_node(self, node: Node, **attrs: Any) -> None:
         self.G.add_node(node, **attrs)
+        self._invalidate_cache()
 
     def add_nodes(self, nodes: Iterable[Node]) -> None:
         self.G.add_nodes_from(nodes)
+        self._invalidate_cache()
 
     def add_edge(self, u: Node, v: Node, **attrs: Any) -> None:
         # Pastikan weight ada jika user tidak set
         if "weight" not in attrs:
             attrs["weight"] = 1.0
         self.G.add_edge(u, v, **attrs)
+        self._invalidate_cache()
 
     def visualize_graph(
         self,
@@ -62,10 +186,12 @@ class Graf:
         draw: DrawOptions = DrawOptions(),
     ) -> Dict[Node, Tuple[float, float]]:
         """Visualisasi graf. Mengembalikan posisi node (pos) agar bisa dipakai ulang."""
+        import matplotlib.pyplot as plt  # lazy: import matplotlib mahal, hanya perlu untuk gambar
+
         if pos is None:
             pos = self._layout(layout)
 
-        plt.figure(figsize=(7.5, 5.5))
+        plt.figure(figsize=(7.5, 5.5), layout="constrained")
         nx.draw(
             self.G,
             pos,
@@ -81,17 +207,17 @@ class Graf:
 
         plt.title(title)
         plt.axis("off")
-        plt.tight_layout()
         plt.show()
         return pos
 
     def shortest_path(self, source: Node, target: Node, *, weight: str = "weight") -> List[Node]:
         """Mengembalikan list node jalur terpendek (berbobot jika weight ada)."""
-        return nx.shortest_path(self.G, source=source, target=target, weight=weight)
+        return self.dijkstra_path(source, target, weight=weight)
 
     def shortest_path_length(self, source: Node, target: Node, *, weight: str = "weight") -> float:
         """Jarak (total bobot) jalur terpendek dari source ke target."""
-        return float(nx.shortest_path_length(self.G, source=source, target=target, weight=weight))
+        length, _path = self._bidirectional_dijkstra(source, target, weight)
+        return length
 
     def visual_shortest_path(
         self,
@@ -104,6 +230,8 @@ class Graf:
         layout: str = "spring",
     ) -> List[Node]:
         """Visualisasi graf dengan jalur terpendek disorot. Return path list."""
+        import matplotlib.pyplot as plt
+
         path = self.shortest_path(source, target, weight=weight)
         if pos is None:
             pos = self._layout(layout)
@@ -111,7 +239,7 @@ class Graf:
         # edges pada path
         path_edges = list(zip(path[:-1], path[1:]))
 
-        plt.figure(figsize=(7.5, 5.5))
+        plt.figure(figsize=(7.5, 5.5), layout="constrained")
 
         # gambar semua edges (tipis)
         nx.draw(
@@ -148,7 +276,6 @@ class Graf:
             title = f"Jalur Terpendek {source} → {target}: {path}"
         plt.title(title)
         plt.axis("off")
-        plt.tight_layout()
         plt.show()
 
         return path
@@ -186,7 +313,8 @@ class Graf:
             comps = nx.strongly_connected_components(self.G)  # type: ignore[arg-type]
         else:
             comps = nx.connected_components(self.G)  # type: ignore[arg-type]
-        return [sorted(c, key=str) for c in comps]
+        rank = self._get_rank()
+        return [sorted(c, key=rank.__getitem__) for c in comps]
 
     def has_path(self, source: Node, target: Node) -> bool:
         self._require_node(source)
@@ -208,16 +336,15 @@ class Graf:
         stabil untuk label alfabet seperti A,B,C,...
         """
         self._require_node(start)
+        sorted_adj = self._get_sorted_adj() if sort_neighbors else None
         visited: set[Node] = {start}
         order: list[Node] = []
-        queue: list[Node] = [start]
+        queue: deque[Node] = deque([start])
 
         while queue:
-            u = queue.pop(0)
+            u = queue.popleft()
             order.append(u)
-            neighbors = list(self.G.neighbors(u))
-            if sort_neighbors:
-                neighbors.sort(key=str)
+            neighbors = sorted_adj[u] if sorted_adj is not None else self.G.neighbors(u)
             for v in neighbors:
                 if v in visited:
                     continue
@@ -229,44 +356,121 @@ class Graf:
         """Urutan DFS rekursif deterministik.
 
         Jika `sort_neighbors=True`, tetangga diproses berdasarkan `str(node)`.
+        Rekursi disimulasikan dengan stack berisi iterator tetangga, sehingga
+        urutannya sama dengan versi rekursif tanpa terbentur batas rekursi Python.
         """
         self._require_node(start)
-        visited: set[Node] = set()
-        order: list[Node] = []
+        sorted_adj = self._get_sorted_adj() if sort_neighbors else None
 
-        def visit(u: Node) -> None:
-            visited.add(u)
-            order.append(u)
-            neighbors = list(self.G.neighbors(u))
-            if sort_neighbors:
-                neighbors.sort(key=str)
-            for v in neighbors:
-                if v not in visited:
-                    visit(v)
+        def neighbors_of(u: Node) -> Iterator[Node]:
+            return iter(sorted_adj[u] if sorted_adj is not None else self.G.neighbors(u))
 
-        visit(start)
+        visited: set[Node] = {start}
+        order: list[Node] = [start]
+        stack: list[Iterator[Node]] = [neighbors_of(start)]
+
+        while stack:
+            for v in stack[-1]:
+                if v not in visited:
+                    visited.add(v)
+                    order.append(v)
+                    stack.append(neighbors_of(v))
+                    break
+            else:
+                stack.pop()
         return order
 
     def dijkstra_distances(self, source: Node, *, weight: str = "weight") -> Dict[Node, float]:
         """Jarak minimum dari source ke semua simpul (Dijkstra, graf berbobot non-negatif)."""
-        self._require_node(source)
-        dist = nx.single_source_dijkstra_path_length(self.G, source=source, weight=weight)
-        return {k: float(v) for k, v in dist.items()}
+        csr = self._csr(weight)
+        dist = self._dijkstra_csr(csr, csr.position(source))
+        nodes = csr.nodes
+        return {nodes[i]: d for i, d in enumerate(dist) if d != float("inf")}
 
     def dijkstra_path(self, source: Node, target: Node, *, weight: str = "weight") -> List[Node]:
         """Jalur terpendek (Dijkstra) dari source ke target."""
-        self._require_node(source)
-        self._require_node(target)
-        return nx.dijkstra_path(self.G, source=source, target=target, weight=weight)
+        _length, path = self._bidirectional_dijkstra(source, target, weight)
+        return path
+
+    def astar_path(
+        self,
+        source: Node,
+        target: Node,
+        *,
+        weight: str = "weight",
+        pos: Optional[Dict[Node, Tuple[float, float]]] = None,
+    ) -> List[Node]:
+        """Jalur terpendek dengan A*, heuristik jarak Euclidean antar posisi node.
+
+        Jika `pos` tidak diberikan, dipakai posisi layout spring. Menghitung layout
+        itu (sekali per graf, lalu di-cache) bisa jauh lebih mahal daripada query
+        A* sendiri; untuk graf besar sebaiknya berikan `pos`. Jarak Euclidean
+        diskalakan dengan rasio bobot/panjang edge terkecil agar heuristik tidak
+        pernah melebihi jarak sebenarnya. Tanpa posisi lengkap, jatuh ke Dijkstra.
+
+        Skala di-cache per `weight` untuk objek `pos` yang sama; jika isi `pos`
+        diubah, kirim dict baru.
+        """
+        csr = self._csr(weight)
+        src, tgt = csr.position(source), csr.position(target)
+        if csr.has_negative:
+            raise ValueError("A* membutuhkan bobot edge non-negatif")
+        coords, scale = self._astar_scale(csr, weight, pos)
+        if scale is None:
+            return self.dijkstra_path(source, target, weight=weight)
+
+        nodes = csr.nodes
+        indptr = csr.indptr_list
+        indices = csr.indices_list
+        weights = csr.weights_list
+        tx, ty = coords[target]
+        heuristic: Dict[int, float] = {}
+
+        def h(i: int) -> float:
+            est = heuristic.get(i)
+            if est is None:
+                x, y = coords[nodes[i]]
+                est = heuristic[i] = scale * math.hypot(x - tx, y - ty)
+            return est
+
+        g_score: Dict[int, float] = {src: 0.0}
+        parents: Dict[int, int] = {src: -1}
+        closed: set[int] = set()
+        heap: list[Tuple[float, float, int]] = [(h(src), 0.0, src)]
+
+        while heap:
+            _f, g, u = heappop(heap)
+            if u in closed:
+                continue
+            if u == tgt:
+                path: list[Node] = []
+                while u != -1:
+                    path.append(nodes[u])
+                    u = parents[u]
+                path.reverse()
+                return path
+            closed.add(u)
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                ng = g + weights[k]
+                if v in closed or ng >= g_score.get(v, float("inf")):
+                    continue
+                g_score[v] = ng
+                parents[v] = u
+                heappush(heap, (ng + h(v), ng, v))
+
+        raise nx.NetworkXNoPath(f"Tidak ada jalur dari {source!r} ke {target!r}")
 
     def has_cycle(self) -> bool:
         if self.directed:
             return not nx.is_directed_acyclic_graph(self.G)
-        try:
-            nx.find_cycle(self.G)
-            return True
-        except nx.exception.NetworkXNoCycle:
-            return False
+        # Seperti Kruskal: edge yang menghubungkan dua simpul di komponen yang sama menutup cycle.
+        index = {n: i for i, n in enumerate(self.G)}
+        ds = _DisjointSet(len(index))
+        for u, v in self.G.edges():
+            if not ds.union(index[u], index[v]):
+                return True
+        return False
 
     def cycles(self) -> List[List[Node]]:
         """Daftar cycle pada graf.
@@ -329,31 +533,182 @@ class Graf:
         if node not in self.G:
             raise ValueError(f"Node {node!r} tidak ada di graf")
 
+    def _invalidate_cache(self) -> None:
+        self._rank = None
+        self._sorted_adj = None
+        self._layout_cache.clear()
+        self._csr_cache.clear()
+        self._astar_cache.clear()
+
+    def _get_sorted_adj(self) -> Dict[Node, List[Node]]:
+        """Daftar tetangga tiap node yang sudah diurutkan berdasarkan `str(node)`."""
+        if self._sorted_adj is None:
+            rank = self._get_rank().__getitem__
+            self._sorted_adj = {n: sorted(self.G.neighbors(n), key=rank) for n in self.G}
+        return self._sorted_adj
+
+    def _get_rank(self) -> Dict[Node, int]:
+        """Peringkat integer tiap node menurut `str(node)`; node dengan str sama dapat peringkat sama.
+
+        Dipakai sebagai key sort yang murah pengganti `key=str`.
+        """
+        if self._rank is None:
+            rank: Dict[Node, int] = {}
+            prev: Optional[str] = None
+            r = -1
+            for n in sorted(self.G, key=str):
+                label = str(n)
+                if label != prev:
+                    r += 1
+                    prev = label
+                rank[n] = r
+            self._rank = rank
+        return self._rank
+
+    def _csr(self, weight: str = "weight") -> _CSR:
+        """Snapshot CSR dari graf untuk atribut bobot `weight` (default bobot 1).
+
+        Untuk MultiGraph, edge paralel diwakili bobot terkecilnya.
+        """
+        csr = self._csr_cache.get(weight)
+        if csr is not None:
+            return csr
+
+        nodes = list(self.G.nodes())
+        index = {n: i for i, n in enumerate(nodes)}
+        # Dict-of-dict asli NetworkX (urutan sama dengan `nodes`); tanpa lapisan view
+        # sehingga iterasi per edge tetap berjalan di C lewat map/chain.
+        adj = self.G._adj
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+        np.cumsum(np.fromiter(map(len, adj.values()), dtype=np.int64, count=len(nodes)), out=indptr[1:])
+
+        indices_list = list(map(index.__getitem__, chain.from_iterable(adj.values())))
+        if self.multigraph:
+            ws = [
+                min(attrs.get(weight, 1.0) for attrs in keydict.values())
+                for nbrs in adj.values()
+                for keydict in nbrs.values()
+            ]
+        else:
+            ws = [data.get(weight, 1.0) for nbrs in adj.values() for data in nbrs.values()]
+        weights = np.array(ws, dtype=np.float64)
+
+        csr = _CSR(
+            index=index,
+            nodes=nodes,
+            indptr=indptr,
+            indices=np.array(indices_list, dtype=np.int32),
+            weights=weights,
+            indptr_list=indptr.tolist(),
+            indices_list=indices_list,
+            weights_list=weights.tolist(),
+            has_negative=bool(weights.size and weights.min() < 0),
+        )
+        self._csr_cache[weight] = csr
+        return csr
+
+    def _bidirectional_dijkstra(self, source: Node, target: Node, weight: str) -> Tuple[float, List[Node]]:
+        """Dijkstra dua arah NetworkX untuk satu pasangan node; mengembalikan `(panjang, jalur)`.
+
+        Satu implementasi dipakai untuk semua query agar perlakuan bobot negatif dan
+        pemilihan jalur saat seri tidak bergantung pada cache yang kebetulan sudah ada.
+        """
+        self._require_node(source)
+        self._require_node(target)
+        length, path = nx.bidirectional_dijkstra(self.G, source, target, weight=weight)
+        return float(length), path
+
+    @staticmethod
+    def _dijkstra_csr(csr: _CSR, src: int) -> List[float]:
+        """Dijkstra berbasis heap di atas array CSR.
+
+        Mengembalikan jarak minimum dari `src` ke tiap node (inf jika tak terjangkau).
+        """
+        if csr.has_negative:
+            raise ValueError("Dijkstra membutuhkan bobot edge non-negatif")
+
+        if csr.indices.size >= _NUMBA_MIN_CSR_ENTRIES:
+            kernel = _load_numba_dijkstra()
+            if kernel is not None:
+                return kernel(csr.indptr, csr.indices, csr.weights, src).tolist()
+
+        indptr = csr.indptr_list
+        indices = csr.indices_list
+        weights = csr.weights_list
+        n = len(csr.nodes)
+        dist = [float("inf")] * n
+        done = [False] * n
+        dist[src] = 0.0
+        heap: list[Tuple[float, int]] = [(0.0, src)]
+        push, pop = heappush, heappop
+
+        while heap:
+            d, u = pop(heap)
+            if done[u]:
+                continue
+            done[u] = True
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    push(heap, (nd, v))
+
+        return dist
+
+    def _astar_scale(
+        self,
+        csr: _CSR,
+        weight: str,
+        pos: Optional[Dict[Node, Tuple[float, float]]],
+    ) -> Tuple[Dict[Node, Tuple[float, float]], Optional[float]]:
+        """Posisi dan skala heuristik A* untuk `weight`, di-cache sampai graf berubah.
+
+        Cache berlaku selama `pos` adalah objek yang sama dengan panggilan sebelumnya
+        (None = layout spring internal). Skala None berarti ada node tanpa posisi.
+        """
+        cached = self._astar_cache.get(weight)
+        if cached is not None and cached[0] is pos:
+            return cached[1], cached[2]
+
+        coords_by_node = self._layout("spring") if pos is None else pos
+        scale: Optional[float] = None
+        if all(n in coords_by_node for n in csr.nodes):
+            coords = np.asarray([coords_by_node[n] for n in csr.nodes], dtype=np.float64)
+            rows = np.repeat(np.arange(len(csr.nodes)), np.diff(csr.indptr))
+            lengths = np.hypot(*(coords[rows] - coords[csr.indices]).T)
+            moved = lengths > 0
+            scale = float(np.min(csr.weights[moved] / lengths[moved])) if moved.any() else 0.0
+        self._astar_cache[weight] = (pos, coords_by_node, scale)
+        return coords_by_node, scale
+
     def _layout(self, layout: str) -> Dict[Node, Tuple[float, float]]:
+        """Posisi node untuk layout tertentu; di-cache sampai graf berubah.
+
+        Di belakang cache per-instance ada cache modul (`_shared_layout`), sehingga
+        objek Graf lain dengan isi graf yang sama tidak menghitung ulang layout.
+        """
         layout = layout.lower().strip()
-        if layout == "spring":
-            return nx.spring_layout(self.G, seed=42)
-        if layout == "kamada_kawai":
-            return nx.kamada_kawai_layout(self.G)
-        if layout == "circular":
-            return nx.circular_layout(self.G)
-        if layout == "shell":
-            return nx.shell_layout(self.G)
-        raise ValueError("layout tidak dikenal. Pilih: spring|kamada_kawai|circular|shell")
+        pos = self._layout_cache.get(layout)
+        if pos is None:
+            pos = _shared_layout(
+                layout,
+                type(self.G),
+                tuple(self.G.nodes()),
+                tuple(self.G.edges(data="weight", default=1.0)),
+            )
+            self._layout_cache[layout] = pos
+        # salinan per array, supaya perubahan oleh pemanggil tidak bocor ke cache
+        return {n: p.copy() for n, p in pos.items()}
 
     def _edge_labels_for_drawing(self) -> Dict[Edge, str]:
         labels: Dict[Edge, str] = {}
         if self.multigraph:
             # MultiGraph: label per (u,v,key) cukup ribet untuk gambar; tampilkan jumlah weight total.
-            for u, v in self.G.edges():
-                data_dict = self.G.get_edge_data(u, v)
-                if not data_dict:
-                    continue
-                total = 0.0
-                for _k, attrs in data_dict.items():
-                    total += float(attrs.get("weight", 1.0))
-                labels[(u, v)] = f"{total:g}"
-            return labels
+            totals: DefaultDict[Edge, float] = defaultdict(float)
+            for u, v, _k, data in self.G.edges(keys=True, data=True):
+                totals[(u, v)] += float(data.get("weight", 1.0))
+            return {edge: f"{total:g}" for edge, total in totals.items()}
 
         for u, v, data in self.G.edges(data=True):
             if "weight" in data: